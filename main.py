@@ -16,14 +16,19 @@ Commands:
 Examples:
     python main.py sync
     python main.py sync --limit 50
+    python main.py sync --full
     python main.py list
     python main.py status
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
-from src.config import Config
-from src.kpi_sync import KPISynchronizer
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.kpi_sync import KPISynchronizer
 
 
 def cmd_sync(synchronizer: KPISynchronizer, args: argparse.Namespace) -> int:
@@ -33,7 +38,8 @@ def cmd_sync(synchronizer: KPISynchronizer, args: argparse.Namespace) -> int:
 
     stats = synchronizer.sync_all_individual_kpi(
         message_limit=args.limit,
-        create_detail_sheets=not args.no_details
+        create_detail_sheets=not args.no_details,
+        full_refresh=args.full
     )
 
     print("\n" + "=" * 50)
@@ -105,6 +111,11 @@ def main():
         action="store_true",
         help="Skip creating individual detail sheets"
     )
+    sync_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Refetch every channel, including those with no new messages"
+    )
 
     # List command
     subparsers.add_parser("list", help="List available individual channels")
@@ -118,6 +129,10 @@ def main():
         parser.print_help()
         return 1
 
+    # Import lazily so --help does not pay for the API client imports
+    from src.config import Config
+    from src.kpi_sync import KPISynchronizer
+
     # Load configuration
     config = Config.from_env()
     errors = config.validate()
@@ -129,10 +144,15 @@ def main():
         print("\nPlease check your .env file and credentials.")
         return 1
 
-    # Initialize synchronizer
+    # Initialize synchronizer with only the connections the command needs
+    connections = {
+        "sync": {"slack": True, "sheets": True},
+        "list": {"slack": True, "sheets": False},
+        "status": {"slack": False, "sheets": True},
+    }
     synchronizer = KPISynchronizer(config)
 
-    if not synchronizer.initialize():
+    if not synchronizer.initialize(**connections[args.command]):
         print("Failed to initialize connections")
         return 1
 
@@ -8,6 +8,9 @@ KPI Integration 統合セットアップ
 import os
 import sys
 import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 def clear_screen():
     os.system('clear' if os.name != 'nt' else 'cls')
@@ -19,55 +22,88 @@ def print_header(title):
     print("=" * 60)
     print()
 
-def check_slack():
-    """Slack設定を確認"""
+def probe_slack():
+    """Slack設定を確認し、(結果, メッセージ) を返す
+
+    SDKを読み込まず、auth.test を直接呼び出します。
+    """
+    # セットアップ中に .env が更新されるため、毎回読み直す
     from dotenv import load_dotenv
     load_dotenv()
 
     token = os.getenv('SLACK_BOT_TOKEN', '')
 
-    if token and token.startswith('xoxb-'):
-        from slack_sdk import WebClient
-        from slack_sdk.errors import SlackApiError
+    if not (token and token.startswith('xoxb-')):
+        return False, "❌ Slack: Bot Token が設定されていません"
 
-        client = WebClient(token=token)
-        try:
-            response = client.auth_test()
-            print(f"✅ Slack: 接続済み ({response['team']})")
-            return True
-        except SlackApiError:
-            print("❌ Slack: トークンが無効です")
-            return False
-    else:
-        print("❌ Slack: Bot Token が設定されていません")
-        return False
+    request = urllib.request.Request(
+        'https://slack.com/api/auth.test',
+        data=b'',
+        method='POST',
+        headers={'Authorization': f'Bearer {token}'}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            result = json.load(response)
+    except (urllib.error.URLError, ValueError) as e:
+        return False, f"❌ Slack: 接続失敗 ({e})"
+
+    if result.get('ok'):
+        return True, f"✅ Slack: 接続済み ({result['team']})"
+    return False, "❌ Slack: トークンが無効です"
+
+def probe_google():
+    """Google Sheets設定を確認し、(結果, メッセージ) を返す
+
+    googleapiclient を読み込まず、Sheets API を直接呼び出します。
+    """
+    # セットアップ中に .env が更新されるため、毎回読み直す
+    from dotenv import load_dotenv
+    load_dotenv()
 
-def check_google():
-    """Google Sheets設定を確認"""
     creds_file = os.path.join(os.path.dirname(__file__), 'credentials.json')
 
     if not os.path.exists(creds_file):
-        print("❌ Google: credentials.json が見つかりません")
-        return False
+        return False, "❌ Google: credentials.json が見つかりません"
 
     try:
+        import httplib2
         from google.oauth2.service_account import Credentials
-        from googleapiclient.discovery import build
+        from google_auth_httplib2 import AuthorizedHttp
 
         creds = Credentials.from_service_account_file(
             creds_file,
             scopes=['https://www.googleapis.com/auth/spreadsheets']
         )
-        service = build('sheets', 'v4', credentials=creds)
+        http = AuthorizedHttp(creds, http=httplib2.Http(timeout=30))
 
         spreadsheet_id = os.getenv('GOOGLE_SPREADSHEET_ID', '1-2FD8zY5lCPudym8GYo7faYpT7U0ok7YqhV9WX8IfKc')
-        result = service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+        response, content = http.request(
+            f'https://sheets.googleapis.com/v4/spreadsheets/{spreadsheet_id}'
+            '?fields=properties.title'
+        )
+        result = json.loads(content)
 
-        print(f"✅ Google: 接続済み ({result['properties']['title']})")
-        return True
+        if response.status != 200:
+            error = result.get('error', {}).get('message', f'HTTP {response.status}')
+            return False, f"❌ Google: 接続失敗 ({error})"
+
+        return True, f"✅ Google: 接続済み ({result['properties']['title']})"
     except Exception as e:
-        print(f"❌ Google: 接続失敗 ({e})")
-        return False
+        return False, f"❌ Google: 接続失敗 ({e})"
+
+def check_all():
+    """Slack と Google Sheets の設定を並行して確認"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(probe_slack), executor.submit(probe_google)]
+        results = [future.result() for future in futures]
+
+    # 表示順を固定するため、結果が揃ってから出力する
+    for _, message in results:
+        print(message)
+
+    slack_ok, google_ok = (ok for ok, _ in results)
+    return slack_ok, google_ok
 
 def setup_slack_token():
     """Slack Bot Tokenを設定"""
@@ -138,8 +174,7 @@ def run_test():
     """テスト実行"""
     print_header("接続テスト")
 
-    slack_ok = check_slack()
-    google_ok = check_google()
+    slack_ok, google_ok = check_all()
 
     print()
 
@@ -164,8 +199,7 @@ def main():
     print("現在の設定状況:")
     print("-" * 40)
 
-    slack_ok = check_slack()
-    google_ok = check_google()
+    slack_ok, google_ok = check_all()
 
     print()
 
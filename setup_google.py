@@ -81,7 +81,7 @@ def test_connection():
     """Google Sheets APIへの接続をテスト"""
     try:
         from google.oauth2.service_account import Credentials
-        from googleapiclient.discovery import build
+        from src.sheets_client import build_sheets_service
 
         creds_file = os.path.join(os.path.dirname(__file__), 'credentials.json')
         creds = Credentials.from_service_account_file(
@@ -89,7 +89,7 @@ def test_connection():
             scopes=['https://www.googleapis.com/auth/spreadsheets']
         )
 
-        service = build('sheets', 'v4', credentials=creds)
+        service = build_sheets_service(creds)
 
         # スプレッドシートのメタデータを取得
         result = service.spreadsheets().get(spreadsheetId=SPREADSHEET_ID).execute()
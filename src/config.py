@@ -2,7 +2,19 @@
 
 import os
 from dataclasses import dataclass
-from dotenv import load_dotenv
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def load_env() -> bool:
+    """Load the .env file into the environment, once per process.
+
+    The interactive setup writes .env while running, so it calls
+    load_dotenv() directly instead.
+    """
+    from dotenv import load_dotenv
+
+    return load_dotenv()
 
 
 @dataclass
@@ -17,7 +29,7 @@ class Config:
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
-        load_dotenv()
+        load_env()
 
         return cls(
             slack_bot_token=os.getenv("SLACK_BOT_TOKEN", ""),
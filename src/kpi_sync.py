@@ -1,11 +1,23 @@
 """Main KPI synchronization logic."""
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    # The API clients pull in heavy SDKs; they are imported in initialize()
+    from .slack_client import SlackKPIClient, KPIMessage, ChannelInfo, PersonBatch
+    from .sheets_client import GoogleSheetsClient
+    from .config import Config
+
+# Timestamp format used in the spreadsheet
+TS_FMT = "%Y-%m-%d %H:%M:%S"
 
-from .slack_client import SlackKPIClient, KPIMessage, ChannelInfo
-from .sheets_client import GoogleSheetsClient
-from .config import Config
+# Maximum length of the latest message shown on the overview sheet
+OVERVIEW_TEXT_LIMIT = 200
 
 
 class KPISynchronizer:
@@ -15,6 +27,13 @@ class KPISynchronizer:
     OVERVIEW_SHEET = "KPI概要"
     DETAIL_SHEET_PREFIX = "詳細_"
 
+    # Overview column holding the Slack ts of the newest message seen in each
+    # channel, KPI or not, at the last sync
+    LAST_TS_COLUMN = 6
+
+    # Cells on the overview sheet holding the channel count and message total
+    SUMMARY_RANGE = "H1:I1"
+
     def __init__(self, config: Config):
         """Initialize the KPI synchronizer.
 
@@ -22,40 +41,57 @@ class KPISynchronizer:
             config: Application configuration
         """
         self.config = config
-        self.slack_client = SlackKPIClient(config.slack_bot_token)
-        self.sheets_client = GoogleSheetsClient(
-            config.google_spreadsheet_id,
-            config.google_credentials_file
-        )
+        self.slack_client: Optional[SlackKPIClient] = None
+        self.sheets_client: Optional[GoogleSheetsClient] = None
+
+    def initialize(self, slack: bool = True, sheets: bool = True) -> bool:
+        """Initialize connections to Slack and/or Google Sheets.
 
-    def initialize(self) -> bool:
-        """Initialize connections to both Slack and Google Sheets.
+        Args:
+            slack: Whether to connect to Slack
+            sheets: Whether to connect to Google Sheets
 
         Returns:
-            True if both connections successful
+            True if all requested connections successful
         """
-        print("Initializing Slack connection...")
-        if not self.slack_client.test_connection():
-            print("Failed to connect to Slack")
-            return False
+        if slack:
+            from .slack_client import SlackKPIClient
+
+            self.slack_client = SlackKPIClient(self.config.slack_bot_token)
+            print("Initializing Slack connection...")
+            if not self.slack_client.test_connection():
+                print("Failed to connect to Slack")
+                return False
 
-        print("Initializing Google Sheets connection...")
-        if not self.sheets_client.authenticate():
-            print("Failed to connect to Google Sheets")
-            return False
+        if sheets:
+            from .sheets_client import GoogleSheetsClient
+
+            self.sheets_client = GoogleSheetsClient(
+                self.config.google_spreadsheet_id,
+                self.config.google_credentials_file
+            )
+            print("Initializing Google Sheets connection...")
+            if not self.sheets_client.authenticate():
+                print("Failed to connect to Google Sheets")
+                return False
 
         return True
 
     def sync_all_individual_kpi(
         self,
         message_limit: int = 100,
-        create_detail_sheets: bool = True
+        create_detail_sheets: bool = True,
+        full_refresh: bool = False
     ) -> dict[str, int]:
         """Sync KPI data from all individual channels to Google Sheets.
 
+        Channels with no new messages since the last sync keep their overview
+        row and detail sheet, unless full_refresh is set.
+
         Args:
             message_limit: Maximum messages to fetch per channel
             create_detail_sheets: Whether to create individual detail sheets
+            full_refresh: Whether to refetch channels with no new messages
 
         Returns:
             Dictionary with sync statistics
@@ -66,42 +102,84 @@ class KPISynchronizer:
             "errors": 0
         }
 
+        # Read the overview and warm the sheet ID cache used by
+        # prepare_sheets() in a single HTTP request
+        with self.sheets_client.http_batch() as batch:
+            batch.load_sheet_ids()
+            # The overview does not exist yet on the first sync
+            overview = batch.read(self.OVERVIEW_SHEET, missing_ok=True)
+
+        # A full refresh still needs the previous rows, as failed channels
+        # carry them forward; it only ignores the watermarks
+        previous_rows = self._index_overview_rows(overview)
+        since = {} if full_refresh else {
+            person_name: row[self.LAST_TS_COLUMN]
+            for person_name, row in previous_rows.items()
+            if len(row) > self.LAST_TS_COLUMN and row[self.LAST_TS_COLUMN]
+        }
+
         print("\nFetching KPI data from Slack...")
-        all_kpi_data = self.slack_client.get_all_individual_kpi_data(message_limit)
+        batches = self.slack_client.get_all_individual_kpi_data(
+            message_limit,
+            since=since
+        )
 
-        if not all_kpi_data:
+        if not batches:
             print("No KPI data found")
             return stats
 
-        # Prepare overview data
-        overview_data = self._prepare_overview_data(all_kpi_data)
-
-        # Write overview sheet
-        print("\nWriting overview sheet...")
-        self.sheets_client.ensure_sheet_exists(self.OVERVIEW_SHEET)
-        if self.sheets_client.write_data(
-            self.OVERVIEW_SHEET,
-            overview_data,
-            clear_first=True
-        ):
-            stats["channels_processed"] = len(all_kpi_data)
-
-        # Create detail sheets for each person
-        if create_detail_sheets:
-            for person_name, messages in all_kpi_data.items():
-                if messages:
-                    detail_sheet_name = f"{self.DETAIL_SHEET_PREFIX}{person_name}"
-                    detail_data = self._prepare_detail_data(person_name, messages)
-
-                    self.sheets_client.ensure_sheet_exists(detail_sheet_name)
-                    if self.sheets_client.write_data(
-                        detail_sheet_name,
-                        detail_data,
-                        clear_first=True
-                    ):
-                        stats["messages_synced"] += len(messages)
-                    else:
-                        stats["errors"] += 1
+        # Failed channels keep their previous overview row and detail sheet
+        failed = sum(batch.failed for batch in batches)
+        stats["errors"] += failed
+
+        detail_batches = [
+            batch for batch in batches if batch.messages
+        ] if create_detail_sheets else []
+        sheet_names = [self.OVERVIEW_SHEET] + [
+            f"{self.DETAIL_SHEET_PREFIX}{batch.person_name}" for batch in detail_batches
+        ]
+
+        # Create, clear and format the sheets on a background thread while the
+        # payload is prepared. A single worker keeps the Sheets connection,
+        # which is not thread-safe, on one thread at a time.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sheets_ready = executor.submit(
+                self.sheets_client.prepare_sheets,
+                sheet_names
+            )
+
+            # Without detail sheets the watermark must not advance, or the
+            # next sync would skip writing them
+            updates = self._prepare_overview_updates(
+                batches,
+                previous_rows,
+                advance_watermarks=create_detail_sheets
+            )
+            messages_synced = 0
+
+            # Prepare detail sheets for each person
+            for batch in detail_batches:
+                detail_sheet_name = f"{self.DETAIL_SHEET_PREFIX}{batch.person_name}"
+                updates.append((
+                    detail_sheet_name,
+                    "A1",
+                    self._prepare_detail_data(batch.person_name, batch.messages)
+                ))
+                messages_synced += batch.count
+
+            sheet_ids = sheets_ready.result()
+
+        # Write all sheets in a single request
+        print("\nWriting sheets...")
+        if sheet_ids is None:
+            stats["errors"] += 1
+            return stats
+
+        if self.sheets_client.batch_write_data(updates):
+            stats["channels_processed"] = len(batches) - failed
+            stats["messages_synced"] = messages_synced
+        else:
+            stats["errors"] += 1
 
         return stats
 
@@ -125,46 +203,101 @@ class KPISynchronizer:
             "errors": 0
         }
 
-        all_channels = self.slack_client.get_all_channels()
-        channel_map = {ch.name: ch for ch in all_channels}
+        from .slack_client import PersonBatch
 
-        kpi_data = {}
+        channel_map = self.slack_client.get_channel_map()
+
+        channels = []
 
         for name in channel_names:
             if name in channel_map:
-                channel = channel_map[name]
                 print(f"Processing: {name}")
-                messages = self.slack_client.get_kpi_data_from_channel(channel, message_limit)
-                person_name = self.slack_client.extract_person_name(name) or name
-                kpi_data[person_name] = messages
-                stats["channels_processed"] += 1
+                channels.append(channel_map[name])
             else:
                 print(f"Channel not found: {name}")
                 stats["errors"] += 1
 
-        if kpi_data:
-            overview_data = self._prepare_overview_data(kpi_data)
-            self.sheets_client.ensure_sheet_exists(self.OVERVIEW_SHEET)
-            self.sheets_client.write_data(
-                self.OVERVIEW_SHEET,
-                overview_data,
-                clear_first=True
+        kpi_by_channel = self.slack_client.get_kpi_data_from_channels(
+            channels,
+            limit=message_limit
+        )
+
+        batches = []
+
+        for channel in channels:
+            history = kpi_by_channel[channel.id]
+            if history.failed:
+                # No previous row to fall back on: leave the channel out
+                stats["errors"] += 1
+                continue
+
+            person_name = self.slack_client.extract_person_name(channel.name) or channel.name
+            batches.append(PersonBatch.from_history(person_name, history))
+            stats["channels_processed"] += 1
+
+        if batches:
+            self.sheets_client.prepare_sheets([self.OVERVIEW_SHEET])
+            self.sheets_client.batch_write_data(
+                self._prepare_overview_updates(batches)
             )
 
-            for person_name, messages in kpi_data.items():
-                if messages:
-                    stats["messages_synced"] += len(messages)
+            stats["messages_synced"] = sum(batch.count for batch in batches)
 
         return stats
 
+    def _index_overview_rows(self, data: list[list[str]]) -> dict[str, list[str]]:
+        """Key the overview rows by person name.
+
+        Args:
+            data: Overview sheet values, including the header row
+
+        Returns:
+            Dictionary mapping person names to their overview rows
+        """
+        return {row[0]: row for row in data[1:] if row}
+
+    def _prepare_overview_updates(
+        self,
+        batches: list[PersonBatch],
+        previous_rows: Optional[dict[str, list[str]]] = None,
+        advance_watermarks: bool = False
+    ) -> list[tuple[str, str, list[list[str]]]]:
+        """Prepare the overview sheet writes, including the summary cells.
+
+        Args:
+            batches: KPI messages per person
+            previous_rows: Current overview rows keyed by person name
+            advance_watermarks: Whether to record the latest message ts
+
+        Returns:
+            List of (sheet name, start cell, values) for the overview sheet
+        """
+        return [
+            (
+                self.OVERVIEW_SHEET,
+                "A1",
+                self._prepare_overview_data(batches, previous_rows, advance_watermarks)
+            ),
+            (
+                self.OVERVIEW_SHEET,
+                self.SUMMARY_RANGE,
+                [["=COUNTA(A2:A)", "=SUM(C2:C)"]]
+            )
+        ]
+
     def _prepare_overview_data(
         self,
-        kpi_data: dict[str, list[KPIMessage]]
+        batches: list[PersonBatch],
+        previous_rows: Optional[dict[str, list[str]]] = None,
+        advance_watermarks: bool = False
     ) -> list[list[str]]:
         """Prepare overview data for the spreadsheet.
 
         Args:
-            kpi_data: Dictionary of person names to KPI messages
+            batches: KPI messages per person; a batch without messages marks
+                a channel that is unchanged since the last sync or failed
+            previous_rows: Current overview rows keyed by person name
+            advance_watermarks: Whether to record the latest message ts
 
         Returns:
             2D list for spreadsheet
@@ -176,31 +309,61 @@ class KPISynchronizer:
             "メッセージ数",
             "最新メッセージ日時",
             "最新メッセージ内容",
-            "同期日時"
+            "同期日時",
+            "最終TS"
         ]
 
-        data = [headers]
-        sync_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        for person_name, messages in sorted(kpi_data.items()):
-            if messages:
-                latest_msg = max(messages, key=lambda m: m.timestamp)
-                latest_time = latest_msg.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                # Truncate long messages
-                latest_text = latest_msg.text[:200] + "..." if len(latest_msg.text) > 200 else latest_msg.text
+        sync_time = datetime.now().strftime(TS_FMT)
+        previous_rows = previous_rows or {}
+        width = len(headers)
+
+        def previous_row(person_name: str) -> list[str]:
+            row = previous_rows.get(person_name, [])
+            return (row + [""] * width)[:width]
+
+        def last_ts(batch: PersonBatch) -> str:
+            if advance_watermarks and batch.latest_ts:
+                ts = batch.latest_ts
             else:
-                latest_time = "-"
-                latest_text = "-"
-
-            row = [
-                person_name,
-                f"個人_{person_name}",
-                str(len(messages)),
-                latest_time,
-                latest_text,
-                sync_time
+                ts = previous_row(batch.person_name)[self.LAST_TS_COLUMN]
+            # Stored as text so the sheet keeps the exact Slack ts
+            return f"'{ts}" if ts else ""
+
+        def row(batch: PersonBatch) -> list[str]:
+            if batch.messages is None:
+                # Unchanged since the last sync, or failed to fetch: carry
+                # the previous row forward
+                previous = previous_row(batch.person_name)[:5]
+                if not previous[0]:
+                    # A failed channel that was never synced
+                    previous = [
+                        batch.person_name,
+                        f"個人_{batch.person_name}",
+                        "0",
+                        "-",
+                        "-"
+                    ]
+                return previous + [
+                    sync_time,
+                    last_ts(batch)
+                ]
+
+            latest = batch.latest
+            return [
+                batch.person_name,
+                f"個人_{batch.person_name}",
+                str(batch.count),
+                latest.timestamp.strftime(TS_FMT) if latest else "-",
+                _truncate(latest.text) if latest else "-",
+                sync_time,
+                last_ts(batch)
             ]
-            data.append(row)
+
+        data = [headers]
+        data.extend(
+            row(batch)
+            for batch in sorted(batches, key=attrgetter("person_name"))
+        )
 
         return data
 
@@ -213,7 +376,7 @@ class KPISynchronizer:
 
         Args:
             person_name: Name of the person
-            messages: List of KPI messages
+            messages: List of KPI messages, newest first
 
         Returns:
             2D list for spreadsheet
@@ -225,28 +388,15 @@ class KPISynchronizer:
             "抽出KPI"
         ]
 
-        data = [headers]
-
-        # Sort messages by timestamp (newest first)
-        sorted_messages = sorted(messages, key=lambda m: m.timestamp, reverse=True)
-
-        for msg in sorted_messages:
-            timestamp = msg.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-
-            # Format KPI values
-            if msg.kpi_values:
-                kpi_str = ", ".join(f"{k}: {v}" for k, v in msg.kpi_values.items())
-            else:
-                kpi_str = "-"
-
-            row = [
-                timestamp,
+        # Messages are already newest first, as returned by Slack
+        return [headers] + [
+            [
+                msg.timestamp.strftime(TS_FMT),
                 msg.text,
-                kpi_str
+                _format_kpi_values(msg.kpi_values)
             ]
-            data.append(row)
-
-        return data
+            for msg in messages
+        ]
 
     def list_available_channels(self) -> list[ChannelInfo]:
         """List all available individual channels.
@@ -269,17 +419,49 @@ class KPISynchronizer:
         }
 
         try:
-            data = self.sheets_client.read_data(self.OVERVIEW_SHEET)
-            if len(data) > 1:
-                status["channels_synced"] = len(data) - 1  # Exclude header
-                # Get last sync time from first data row
-                if len(data[1]) >= 6:
-                    status["last_sync"] = data[1][5]
-                # Sum message counts
-                status["total_messages"] = sum(
-                    int(row[2]) for row in data[1:] if len(row) > 2 and row[2].isdigit()
-                )
+            count_cell, total_cell = self.SUMMARY_RANGE.split(":")
+            last_sync, channels_synced, total_messages = (
+                values[0][0] if values and values[0] else None
+                for values in self.sheets_client.read_many([
+                    (self.OVERVIEW_SHEET, "F2"),
+                    (self.OVERVIEW_SHEET, count_cell),
+                    (self.OVERVIEW_SHEET, total_cell),
+                ]).values()
+            )
+            status["last_sync"] = last_sync
+
+            if channels_synced is not None and total_messages is not None:
+                status["channels_synced"] = _parse_int(channels_synced)
+                status["total_messages"] = _parse_int(total_messages)
+            else:
+                # Overview written without summary cells: aggregate the
+                # name and message count columns instead of whole rows
+                names, _, counts = (self.sheets_client.read_data(
+                    self.OVERVIEW_SHEET,
+                    "A2:C",
+                    major_dimension="COLUMNS"
+                ) + [[], [], []])[:3]
+                status["channels_synced"] = sum(1 for name in names if name)
+                status["total_messages"] = sum(map(_parse_int, counts))
         except Exception as e:
             print(f"Error getting sync status: {e}")
 
         return status
+
+
+def _parse_int(value: Optional[str]) -> int:
+    """Parse a formatted spreadsheet number, returning 0 if it is not numeric."""
+    text = str(value or "").replace(",", "")
+    return int(text) if text.isdigit() else 0
+
+
+def _format_kpi_values(kpi_values: dict[str, str]) -> str:
+    """Format extracted KPI values for a detail row."""
+    if not kpi_values:
+        return "-"
+    return ", ".join(f"{k}: {v}" for k, v in kpi_values.items())
+
+
+def _truncate(text: str, limit: int = OVERVIEW_TEXT_LIMIT) -> str:
+    """Truncate long messages, appending an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
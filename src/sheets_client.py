@@ -1,23 +1,91 @@
 """Google Sheets API client for writing KPI data."""
 
+import itertools
+import json
 import os
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
 from datetime import datetime
 
 from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+import httplib2
 import pickle
 
+try:
+    # Faster encoding of large write bodies when the native module is present
+    import orjson
+except ImportError:
+    orjson = None
+
+# Socket timeout in seconds for Sheets API requests
+HTTP_TIMEOUT = 30
+
+
+class OrjsonModel(JsonModel):
+    """JSON model that encodes and decodes request bodies with orjson.
+
+    Request bodies are UTF-8 bytes, since the HTTP layer can only send text
+    bodies that are Latin-1.
+    """
+
+    def serialize(self, body_value: Any) -> bytes:
+        """Serialize a request body to JSON text."""
+        if self._data_wrapper:
+            return super().serialize(body_value)
+        return orjson.dumps(body_value)
+
+    def deserialize(self, content: Any) -> Any:
+        """Deserialize a JSON response body."""
+        if self._data_wrapper:
+            return super().deserialize(content)
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the base model handle non-JSON bodies the same way
+            return super().deserialize(content)
+
+
+def build_sheets_service(creds) -> Any:
+    """Build a Sheets API service on a single keep-alive connection.
+
+    Uses the discovery document bundled with google-api-python-client, so no
+    discovery request is made. Bodies are encoded with orjson if installed.
+
+    Args:
+        creds: Google credentials
+
+    Returns:
+        Sheets API service resource
+    """
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+    return build(
+        "sheets", "v4",
+        http=http,
+        model=OrjsonModel() if orjson else JsonModel(),
+        cache_discovery=False,
+        static_discovery=True
+    )
+
 
 class GoogleSheetsClient:
     """Client for writing KPI data to Google Sheets."""
 
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+    # Retries with exponential backoff for 429 and 5xx responses
+    NUM_RETRIES = 5
+
+    # Service account credentials keyed by (file path, mtime), shared by all
+    # clients in the process
+    _service_account_cache: dict[tuple[str, float], ServiceAccountCredentials] = {}
+
     def __init__(self, spreadsheet_id: str, credentials_file: str):
         """Initialize the Google Sheets client.
 
@@ -29,6 +97,8 @@ class GoogleSheetsClient:
         self.credentials_file = credentials_file
         self.service = None
         self._creds = None
+        # Sheet IDs keyed by title, loaded on first use
+        self._sheet_ids: Optional[dict[str, int]] = None
 
     def authenticate(self) -> bool:
         """Authenticate with Google Sheets API.
@@ -43,10 +113,18 @@ class GoogleSheetsClient:
             # Check for service account credentials
             if self.credentials_file.endswith(".json"):
                 try:
-                    # Try service account first
-                    creds = ServiceAccountCredentials.from_service_account_file(
-                        self.credentials_file, scopes=self.SCOPES
+                    # Try service account first, reusing credentials loaded
+                    # from the same unmodified file
+                    cache_key = (
+                        self.credentials_file,
+                        os.path.getmtime(self.credentials_file)
                     )
+                    creds = self._service_account_cache.get(cache_key)
+                    if creds is None:
+                        creds = ServiceAccountCredentials.from_service_account_file(
+                            self.credentials_file, scopes=self.SCOPES
+                        )
+                        self._service_account_cache[cache_key] = creds
                     print("Authenticated using service account")
                 except Exception:
                     # Fall back to OAuth flow
@@ -72,8 +150,11 @@ class GoogleSheetsClient:
                     with open(token_file, "wb") as token:
                         pickle.dump(creds, token)
 
-            self._creds = creds
-            self.service = build("sheets", "v4", credentials=creds)
+            # Keep the existing connection when re-authenticating with the
+            # same credentials
+            if self.service is None or creds is not self._creds:
+                self._creds = creds
+                self.service = build_sheets_service(creds)
             print("Successfully connected to Google Sheets API")
             return True
 
@@ -81,41 +162,75 @@ class GoogleSheetsClient:
             print(f"Failed to authenticate with Google Sheets: {e}")
             return False
 
-    def get_spreadsheet_info(self) -> Optional[dict]:
+    def get_spreadsheet_info(self, fields: Optional[str] = None) -> Optional[dict]:
         """Get spreadsheet metadata.
 
+        Args:
+            fields: Optional field mask limiting the returned metadata
+
         Returns:
             Spreadsheet metadata or None on error
         """
         try:
             result = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id
-            ).execute()
+                spreadsheetId=self.spreadsheet_id,
+                fields=fields
+            ).execute(num_retries=self.NUM_RETRIES)
             return result
         except HttpError as e:
             print(f"Error getting spreadsheet info: {e}")
             return None
 
+    def get_sheet_ids(self, refresh: bool = False) -> Optional[dict[str, int]]:
+        """Get the IDs of all sheets in the spreadsheet, keyed by title.
+
+        The result is cached until a request fails or refresh is set.
+
+        Args:
+            refresh: Whether to refetch the sheet metadata
+
+        Returns:
+            Dictionary mapping sheet names to sheet IDs, or None on error
+        """
+        if self._sheet_ids is None or refresh:
+            info = self.get_spreadsheet_info(fields="sheets.properties(sheetId,title)")
+            if info is None:
+                return None
+
+            self._sheet_ids = _parse_sheet_ids(info)
+
+        return self._sheet_ids
+
+    @contextmanager
+    def http_batch(self) -> Iterator["SheetsHttpBatch"]:
+        """Collect independent API calls and send them in one HTTP request.
+
+        The calls are sent when the with block exits. Results returned by
+        the batch methods are filled in at that point.
+
+        Yields:
+            Batch to add calls to
+        """
+        batch = SheetsHttpBatch(self)
+        yield batch
+        batch.execute()
+
     def get_sheet_names(self) -> list[str]:
         """Get all sheet names in the spreadsheet.
 
         Returns:
             List of sheet names
         """
-        info = self.get_spreadsheet_info()
-        if not info:
-            return []
+        return list(self.get_sheet_ids() or [])
 
-        return [sheet["properties"]["title"] for sheet in info.get("sheets", [])]
-
-    def create_sheet(self, sheet_name: str) -> bool:
+    def create_sheet(self, sheet_name: str) -> Optional[int]:
         """Create a new sheet in the spreadsheet.
 
         Args:
             sheet_name: Name for the new sheet
 
         Returns:
-            True if successful
+            ID of the new or already existing sheet, or None on error
         """
         try:
             request = {
@@ -127,18 +242,25 @@ class GoogleSheetsClient:
                     }
                 }]
             }
-            self.service.spreadsheets().batchUpdate(
+            result = self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
-                body=request
-            ).execute()
+                body=request,
+                fields="replies.addSheet.properties.sheetId"
+            ).execute(num_retries=self.NUM_RETRIES)
+            # sheetId 0 is omitted from the reply
+            properties = result["replies"][0]["addSheet"]["properties"]
+            sheet_id = properties.get("sheetId", 0)
+            if self._sheet_ids is not None:
+                self._sheet_ids[sheet_name] = sheet_id
             print(f"Created sheet: {sheet_name}")
-            return True
+            return sheet_id
         except HttpError as e:
-            if "already exists" in str(e):
+            self._sheet_ids = None
+            if _is_already_exists(e):
                 print(f"Sheet already exists: {sheet_name}")
-                return True
+                return (self.get_sheet_ids() or {}).get(sheet_name)
             print(f"Error creating sheet: {e}")
-            return False
+            return None
 
     def clear_sheet(self, sheet_name: str) -> bool:
         """Clear all data from a sheet.
@@ -152,8 +274,9 @@ class GoogleSheetsClient:
         try:
             self.service.spreadsheets().values().clear(
                 spreadsheetId=self.spreadsheet_id,
-                range=f"'{sheet_name}'!A:Z"
-            ).execute()
+                range=f"'{sheet_name}'!A:Z",
+                fields="clearedRange"
+            ).execute(num_retries=self.NUM_RETRIES)
             return True
         except HttpError as e:
             print(f"Error clearing sheet: {e}")
@@ -188,8 +311,9 @@ class GoogleSheetsClient:
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption="USER_ENTERED",
-                body=body
-            ).execute()
+                body=body,
+                fields="updatedCells"
+            ).execute(num_retries=self.NUM_RETRIES)
 
             updated_cells = result.get("updatedCells", 0)
             print(f"Updated {updated_cells} cells in {sheet_name}")
@@ -199,6 +323,73 @@ class GoogleSheetsClient:
             print(f"Error writing data: {e}")
             return False
 
+    def write_many(
+        self,
+        value_ranges: list[dict[str, Any]],
+        clear_first: bool = False
+    ) -> bool:
+        """Write several ranges in a single batchUpdate request.
+
+        Args:
+            value_ranges: List of ValueRange dicts ({"range": ..., "values": ...})
+            clear_first: Whether to clear the target sheets first
+
+        Returns:
+            True if successful
+        """
+        if not value_ranges:
+            return True
+
+        try:
+            if clear_first:
+                sheet_ranges = list(dict.fromkeys(
+                    f"{vr['range'].rsplit('!', 1)[0]}!A:Z" for vr in value_ranges
+                ))
+                self.service.spreadsheets().values().batchClear(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={"ranges": sheet_ranges},
+                    fields="spreadsheetId"
+                ).execute(num_retries=self.NUM_RETRIES)
+
+            result = self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={
+                    "valueInputOption": "USER_ENTERED",
+                    "data": value_ranges
+                },
+                fields="totalUpdatedCells"
+            ).execute(num_retries=self.NUM_RETRIES)
+
+            updated_cells = result.get("totalUpdatedCells", 0)
+            print(f"Updated {updated_cells} cells in {len(value_ranges)} ranges")
+            return True
+
+        except HttpError as e:
+            print(f"Error writing data: {e}")
+            return False
+
+    def batch_write_data(
+        self,
+        updates: list[tuple[str, str, list[list[Any]]]],
+        clear_first: bool = False
+    ) -> bool:
+        """Write data to several sheets in a single request.
+
+        Args:
+            updates: List of (sheet name, start cell, 2D list of values)
+            clear_first: Whether to clear the target sheets first
+
+        Returns:
+            True if successful
+        """
+        return self.write_many(
+            [
+                {"range": f"'{sheet_name}'!{start_cell}", "values": data}
+                for sheet_name, start_cell, data in updates
+            ],
+            clear_first=clear_first
+        )
+
     def append_data(self, sheet_name: str, data: list[list[Any]]) -> bool:
         """Append data to the end of a sheet.
 
@@ -218,8 +409,9 @@ class GoogleSheetsClient:
                 range=range_name,
                 valueInputOption="USER_ENTERED",
                 insertDataOption="INSERT_ROWS",
-                body=body
-            ).execute()
+                body=body,
+                fields="updates.updatedRows"
+            ).execute(num_retries=self.NUM_RETRIES)
 
             updates = result.get("updates", {})
             updated_rows = updates.get("updatedRows", 0)
@@ -230,12 +422,18 @@ class GoogleSheetsClient:
             print(f"Error appending data: {e}")
             return False
 
-    def read_data(self, sheet_name: str, range_spec: str = "A:Z") -> list[list[Any]]:
+    def read_data(
+        self,
+        sheet_name: str,
+        range_spec: str = "A:Z",
+        major_dimension: str = "ROWS"
+    ) -> list[list[Any]]:
         """Read data from a sheet.
 
         Args:
             sheet_name: Name of the sheet
             range_spec: Range to read (e.g., "A:Z" or "A1:D10")
+            major_dimension: "ROWS" or "COLUMNS"
 
         Returns:
             2D list of values
@@ -244,81 +442,372 @@ class GoogleSheetsClient:
             range_name = f"'{sheet_name}'!{range_spec}"
             result = self.service.spreadsheets().values().get(
                 spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
+                range=range_name,
+                majorDimension=major_dimension
+            ).execute(num_retries=self.NUM_RETRIES)
             return result.get("values", [])
 
         except HttpError as e:
             print(f"Error reading data: {e}")
             return []
 
-    def format_header_row(self, sheet_name: str, sheet_id: int = 0) -> bool:
+    def read_many(
+        self,
+        ranges: list[tuple[str, str]],
+        major_dimension: str = "ROWS"
+    ) -> dict[tuple[str, str], list[list[Any]]]:
+        """Read ranges from several sheets in a single batchGet request.
+
+        Args:
+            ranges: List of (sheet name, range) tuples, e.g. ("KPI概要", "A1:G")
+            major_dimension: "ROWS" or "COLUMNS"
+
+        Returns:
+            Dictionary mapping each (sheet name, range) tuple to its 2D list
+            of values
+        """
+        try:
+            result = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=[f"'{sheet}'!{range_spec}" for sheet, range_spec in ranges],
+                majorDimension=major_dimension
+            ).execute(num_retries=self.NUM_RETRIES)
+            return {
+                key: value_range.get("values", [])
+                for key, value_range in zip(ranges, result.get("valueRanges", []))
+            }
+
+        except HttpError as e:
+            print(f"Error reading data: {e}")
+            return {key: [] for key in ranges}
+
+    @staticmethod
+    def _header_format_requests(sheet_id: int) -> list[dict]:
+        """Build batchUpdate requests that format a sheet's header row.
+
+        Args:
+            sheet_id: Numeric ID of the sheet
+
+        Returns:
+            List of batchUpdate requests
+        """
+        return [
+            {
+                "repeatCell": {
+                    "range": {
+                        "sheetId": sheet_id,
+                        "startRowIndex": 0,
+                        "endRowIndex": 1
+                    },
+                    "cell": {
+                        "userEnteredFormat": {
+                            "backgroundColor": {
+                                "red": 0.9,
+                                "green": 0.9,
+                                "blue": 0.9
+                            },
+                            "textFormat": {
+                                "bold": True
+                            }
+                        }
+                    },
+                    "fields": "userEnteredFormat(backgroundColor,textFormat)"
+                }
+            },
+            {
+                "updateSheetProperties": {
+                    "properties": {
+                        "sheetId": sheet_id,
+                        "gridProperties": {
+                            "frozenRowCount": 1
+                        }
+                    },
+                    "fields": "gridProperties.frozenRowCount"
+                }
+            }
+        ]
+
+    def format_header_row(self, sheet_name: str, sheet_id: Optional[int] = None) -> bool:
         """Format the header row with bold text and background color.
 
         Args:
             sheet_name: Name of the sheet
-            sheet_id: Numeric ID of the sheet
+            sheet_id: Numeric ID of the sheet, as returned by create_sheet(),
+                ensure_sheet_exists() or prepare_sheets(). Looked up from the
+                cached sheet IDs if omitted.
 
         Returns:
             True if successful
         """
+        if sheet_id is None:
+            sheet_id = (self.get_sheet_ids() or {}).get(sheet_name)
+            if sheet_id is None:
+                print(f"Sheet not found: {sheet_name}")
+                return False
+
         try:
-            requests = [
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": 0,
-                            "endRowIndex": 1
-                        },
-                        "cell": {
-                            "userEnteredFormat": {
-                                "backgroundColor": {
-                                    "red": 0.9,
-                                    "green": 0.9,
-                                    "blue": 0.9
-                                },
-                                "textFormat": {
-                                    "bold": True
-                                }
-                            }
-                        },
-                        "fields": "userEnteredFormat(backgroundColor,textFormat)"
-                    }
-                },
-                {
-                    "updateSheetProperties": {
-                        "properties": {
-                            "sheetId": sheet_id,
-                            "gridProperties": {
-                                "frozenRowCount": 1
-                            }
-                        },
-                        "fields": "gridProperties.frozenRowCount"
-                    }
-                }
-            ]
+            requests = self._header_format_requests(sheet_id)
 
             self.service.spreadsheets().batchUpdate(
                 spreadsheetId=self.spreadsheet_id,
                 body={"requests": requests}
-            ).execute()
+            ).execute(num_retries=self.NUM_RETRIES)
             return True
 
         except HttpError as e:
             print(f"Error formatting header: {e}")
             return False
 
-    def ensure_sheet_exists(self, sheet_name: str) -> bool:
+    def ensure_sheet_exists(self, sheet_name: str) -> Optional[int]:
         """Ensure a sheet exists, creating it if necessary.
 
         Args:
             sheet_name: Name of the sheet
 
         Returns:
-            True if sheet exists or was created
+            ID of the sheet, or None on error
         """
-        existing_sheets = self.get_sheet_names()
-        if sheet_name not in existing_sheets:
+        sheet_ids = self.get_sheet_ids()
+        if sheet_ids is None:
+            return None
+        if sheet_name not in sheet_ids:
             return self.create_sheet(sheet_name)
+        return sheet_ids[sheet_name]
+
+    def ensure_sheets_exist(self, sheet_names: list[str]) -> bool:
+        """Ensure several sheets exist, creating missing ones in one request.
+
+        Args:
+            sheet_names: Names of the sheets
+
+        Returns:
+            True if all sheets exist or were created
+        """
+        return self.prepare_sheets(
+            sheet_names,
+            clear=False,
+            format_header=False
+        ) is not None
+
+    def prepare_sheets(
+        self,
+        sheet_names: list[str],
+        clear: bool = True,
+        format_header: bool = True
+    ) -> Optional[dict[str, int]]:
+        """Create, clear and format several sheets in one batchUpdate.
+
+        Missing sheets are added with client-assigned sheet IDs, so the
+        clear and format requests for them can go in the same batch.
+
+        Args:
+            sheet_names: Names of the sheets
+            clear: Whether to clear all values from the sheets
+            format_header: Whether to format the header rows
+
+        Returns:
+            Dictionary mapping sheet names to sheet IDs, or None on error
+        """
+        cached_ids = self.get_sheet_ids()
+        if cached_ids is None:
+            return None
+
+        try:
+            sheet_ids = dict(cached_ids)
+            used_ids = set(sheet_ids.values())
+            free_ids = (n for n in itertools.count(1) if n not in used_ids)
+            created = []
+            requests = []
+
+            for name in dict.fromkeys(sheet_names):
+                if name not in sheet_ids:
+                    sheet_ids[name] = next(free_ids)
+                    created.append(name)
+                    requests.append({
+                        "addSheet": {
+                            "properties": {"title": name, "sheetId": sheet_ids[name]}
+                        }
+                    })
+                if clear:
+                    requests.append({
+                        "updateCells": {
+                            "range": {"sheetId": sheet_ids[name]},
+                            "fields": "userEnteredValue"
+                        }
+                    })
+                if format_header:
+                    requests.extend(self._header_format_requests(sheet_ids[name]))
+
+            if requests:
+                self.service.spreadsheets().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={"requests": requests},
+                    fields="spreadsheetId"
+                ).execute(num_retries=self.NUM_RETRIES)
+                for name in created:
+                    print(f"Created sheet: {name}")
+                self._sheet_ids = sheet_ids
+
+            return {name: sheet_ids[name] for name in sheet_names}
+
+        except HttpError as e:
+            self._sheet_ids = None
+            print(f"Error preparing sheets: {e}")
+            return None
+
+
+class SheetsHttpBatch:
+    """Sheets API calls multiplexed into a single HTTP batch request.
+
+    The API may run batched calls in any order, so only calls that do not
+    depend on each other (e.g. reads, or writes to different ranges) belong
+    in the same batch.
+    """
+
+    def __init__(self, client: GoogleSheetsClient):
+        """Initialize an empty batch.
+
+        Args:
+            client: Authenticated Sheets client
+        """
+        self.client = client
+        self.ok = True
+        self._handlers: dict[str, Callable[[dict], None]] = {}
+        # Reads of sheets that may not exist yet, where a 400 means empty
+        self._missing_ok: set[str] = set()
+        self._batch = client.service.new_batch_http_request(callback=self._on_response)
+
+    def _add(self, request: Any, handler: Callable[[dict], None]) -> str:
+        """Add a request and the handler for its response.
+
+        Returns:
+            ID of the request within the batch
+        """
+        if isinstance(request.body, bytes):
+            # Batch parts are serialized as text, so orjson's UTF-8 bodies
+            # are re-encoded as ASCII-only JSON
+            request.body = json.dumps(json.loads(request.body))
+        request_id = str(len(self._handlers))
+        self._handlers[request_id] = handler
+        self._batch.add(request, request_id=request_id)
+        return request_id
+
+    def _on_response(self, request_id: str, response: dict, exception: Optional[Exception]) -> None:
+        """Dispatch a batched response to its handler."""
+        if exception is not None:
+            if (
+                request_id in self._missing_ok
+                and isinstance(exception, HttpError)
+                and exception.resp.status == 400
+            ):
+                # Range of a sheet that does not exist yet
+                return
+            print(f"Error in batched request: {exception}")
+            self.ok = False
+            return
+        self._handlers[request_id](response)
+
+    def read(
+        self,
+        sheet_name: str,
+        range_spec: str = "A:Z",
+        missing_ok: bool = False
+    ) -> list[list[Any]]:
+        """Read data from a sheet.
+
+        Args:
+            sheet_name: Name of the sheet
+            range_spec: Range to read (e.g., "A:Z" or "A1:D10")
+            missing_ok: Whether a missing sheet reads as empty instead of
+                an error
+
+        Returns:
+            2D list of values, filled in when the batch is sent
+        """
+        values: list[list[Any]] = []
+        request_id = self._add(
+            self.client.service.spreadsheets().values().get(
+                spreadsheetId=self.client.spreadsheet_id,
+                range=f"'{sheet_name}'!{range_spec}"
+            ),
+            lambda response: values.extend(response.get("values", []))
+        )
+        if missing_ok:
+            self._missing_ok.add(request_id)
+        return values
+
+    def write(self, sheet_name: str, start_cell: str, data: list[list[Any]]) -> None:
+        """Write data to a sheet.
+
+        Args:
+            sheet_name: Name of the sheet
+            start_cell: Starting cell (e.g., "A1")
+            data: 2D list of values to write
+        """
+        self._add(
+            self.client.service.spreadsheets().values().update(
+                spreadsheetId=self.client.spreadsheet_id,
+                range=f"'{sheet_name}'!{start_cell}",
+                valueInputOption="USER_ENTERED",
+                body={"values": data},
+                fields="updatedCells"
+            ),
+            lambda response: print(
+                f"Updated {response.get('updatedCells', 0)} cells in {sheet_name}"
+            )
+        )
+
+    def load_sheet_ids(self) -> None:
+        """Fill the client's sheet ID cache as part of the batch."""
+        def store(response: dict) -> None:
+            self.client._sheet_ids = _parse_sheet_ids(response)
+
+        self._add(
+            self.client.service.spreadsheets().get(
+                spreadsheetId=self.client.spreadsheet_id,
+                fields="sheets.properties(sheetId,title)"
+            ),
+            store
+        )
+
+    def execute(self) -> bool:
+        """Send all collected calls.
+
+        Returns:
+            True if every call succeeded
+        """
+        if not self._handlers:
+            return True
+
+        try:
+            self._batch.execute()
+        except HttpError as e:
+            print(f"Error sending batch: {e}")
+            self.ok = False
+        return self.ok
+
+
+def _is_already_exists(error: HttpError) -> bool:
+    """Check whether an API error reports that the resource already exists."""
+    if error.resp.status != 400:
+        return False
+
+    details = error.error_details if isinstance(error.error_details, list) else []
+    if any(
+        isinstance(detail, dict) and detail.get("reason") == "ALREADY_EXISTS"
+        for detail in details
+    ):
         return True
+
+    # The Sheets API reports duplicate sheet titles as INVALID_ARGUMENT with
+    # no detail reason, so fall back to the parsed error message
+    return "already exists" in error.reason
+
+
+def _parse_sheet_ids(info: dict) -> dict[str, int]:
+    """Map sheet titles to sheet IDs in spreadsheet metadata."""
+    return {
+        # sheetId 0 is omitted from the response
+        sheet["properties"]["title"]: sheet["properties"].get("sheetId", 0)
+        for sheet in info.get("sheets", [])
+    }
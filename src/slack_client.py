@@ -1,11 +1,161 @@
 """Slack API client for extracting KPI data from channels."""
 
+import asyncio
+import functools
+import json
+import os
 import re
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from typing import Optional
+
+import aiohttp
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncConnectionErrorRetryHandler,
+    AsyncRateLimitErrorRetryHandler,
+    AsyncServerErrorRetryHandler,
+)
+from slack_sdk.http_retry.builtin_handlers import (
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+    ServerErrorRetryHandler,
+)
+from slack_sdk.web.async_client import AsyncWebClient
+
+try:
+    # Linear-time matching for the KPI patterns when the native module is present
+    import re2 as kpi_re
+except ImportError:
+    kpi_re = re
+
+# Prefix of individual channels (個人_名前 format)
+_INDIVIDUAL_CHANNEL_PREFIX = "個人_"
+
+# Pattern to match individual channels, for callers matching arbitrary text
+_INDIVIDUAL_CHANNEL_PATTERN = re.compile(rf"^{_INDIVIDUAL_CHANNEL_PREFIX}(.+)$")
+
+# Largest page conversations.history returns
+_HISTORY_PAGE_SIZE = 200
+
+# Digit and whitespace classes spelled out because RE2's \d and \s are
+# ASCII-only, while the KPI messages may use full-width characters
+_DIGIT = "[0-9０-９]"
+_SPACE = r"[\s　]"
+# Whitespace that does not cross lines
+_LINE_SPACE = "[ \t　]"
+# Separator between a KPI name and its value; a single character class, as
+# nested repeats of overlapping classes backtrack polynomially on long
+# whitespace runs
+_KPI_SEPARATOR = r"[\s　:：]"
+
+# Every KPI value contains a digit; messages without one skip the full pattern
+_HAS_DIGIT = re.compile(_DIGIT)
+
+# KPI value with an optional unit
+_KPI_VALUE = rf"{_DIGIT}+(?:\.{_DIGIT}+)?(?:%|件|円|人|回)?"
+
+# Common KPI patterns, fused into one alternation so each message is scanned
+# once. Earlier alternatives take precedence where matches overlap.
+_KPI_PATTERN = kpi_re.compile(
+    # ^ matches at every line start
+    r"(?m)"
+    # Pattern: "【KPI名】値"
+    rf"【(?P<bracket_key>[^】]+)】{_SPACE}*(?P<bracket_value>{_KPI_VALUE})"
+    # Pattern with specific KPI keywords; the 数/件/率 suffix is part of the
+    # key so that e.g. 契約数 and 契約率 stay separate KPIs
+    rf"|(?P<keyword_key>(?:売上|契約|アポ|架電|面談|成約)[数件率]?){_KPI_SEPARATOR}*"
+    rf"(?P<keyword_value>{_KPI_VALUE})"
+    # Pattern: "KPI名: 値" or "KPI名：値" at the start of a line, optionally
+    # after a list marker ("•", "-", "1." ...), as KPI reports put one item
+    # per line. Unanchored, it was retried at every position of long messages.
+    # The prefix only matches within the line, so blank-line runs fail fast.
+    # "*" is a list marker only when followed by a space; otherwise it is
+    # Slack bold markup ("*訪問*: 3") and stripped from around the key.
+    rf"|^{_LINE_SPACE}*(?:(?:[-•・]|{_DIGIT}+[.)．）]){_LINE_SPACE}*|\*{_LINE_SPACE}+)?"
+    rf"\*?(?P<generic_key>[^\s　:：*]+)\*?{_KPI_SEPARATOR}+(?P<generic_value>{_KPI_VALUE})"
+)
+
+
+def _extract_kpi_values(text: str) -> dict[str, str]:
+    """Extract KPI values from message text.
+
+    >>> _extract_kpi_values("契約数: 3\\n契約率: 30%")
+    {'契約数': '3', '契約率': '30%'}
+    >>> _extract_kpi_values("架電数：50\\nアポ数：5\\nアポ率：10%")
+    {'架電数': '50', 'アポ数': '5', 'アポ率': '10%'}
+    >>> _extract_kpi_values("• 訪問: 3\\n• 商談: 2")
+    {'訪問': '3', '商談': '2'}
+    >>> _extract_kpi_values("- 訪問: 3\\n1. 商談: 2")
+    {'訪問': '3', '商談': '2'}
+    >>> _extract_kpi_values("*訪問*: 3\\n* *商談*: 2")
+    {'訪問': '3', '商談': '2'}
+
+    Long whitespace runs are scanned in linear time:
+
+    >>> _extract_kpi_values("1" + "\\n" * 20000)
+    {}
+    >>> _extract_kpi_values("売上" + "\\n" * 20000 + "x1")
+    {}
+    """
+    if not _HAS_DIGIT.search(text):
+        return {}
+
+    kpi_values = {}
+
+    for match in _KPI_PATTERN.finditer(text):
+        # Exactly one alternative matched; its pair is the only one set
+        key = (
+            match.group("bracket_key")
+            or match.group("keyword_key")
+            or match.group("generic_key")
+        )
+        value = (
+            match.group("bracket_value")
+            or match.group("keyword_value")
+            or match.group("generic_value")
+        )
+        kpi_values[key.strip()] = value.strip()
+
+    return kpi_values
+
+
+def _parse_ts(ts: str) -> Optional[Decimal]:
+    """Parse a Slack ts for exact ordering, or None if it is not a ts."""
+    try:
+        return Decimal(ts)
+    except InvalidOperation:
+        return None
+
+
+def _history_page_size(limit: int, fetched: int) -> int:
+    """Number of messages to request next: only what is still needed."""
+    return min(_HISTORY_PAGE_SIZE, limit - fetched)
+
+
+def _add_history_page(messages: list[dict], response, limit: int) -> Optional[str]:
+    """Append a conversations.history page, up to limit messages.
+
+    Returns:
+        Cursor of the next page, or None once the history is complete
+    """
+    messages.extend(response["messages"][:limit - len(messages)])
+    cursor = response.get("response_metadata", {}).get("next_cursor")
+    if not response.get("has_more") or not cursor:
+        return None
+    return cursor
+
+
+def _extract_person_name(channel_name: str) -> Optional[str]:
+    """Extract person name from a 個人_名前 channel name."""
+    if channel_name.startswith(_INDIVIDUAL_CHANNEL_PREFIX):
+        # An empty name does not match the 個人_名前 pattern
+        return channel_name[len(_INDIVIDUAL_CHANNEL_PREFIX):] or None
+    return None
 
 
 @dataclass
@@ -15,9 +165,63 @@ class KPIMessage:
     channel_id: str
     channel_name: str
     user_name: str
-    timestamp: datetime
     text: str
     kpi_values: dict[str, str]
+    ts: str
+
+    @functools.cached_property
+    def timestamp(self) -> datetime:
+        """Local time of the message, converted from ts on first access."""
+        return datetime.fromtimestamp(float(self.ts or 0))
+
+
+@dataclass(slots=True, frozen=True)
+class ChannelHistory:
+    """KPI messages fetched from one channel."""
+
+    # Newest first; None if the channel is unchanged since the last sync
+    messages: Optional[list[KPIMessage]]
+    # Slack ts of the newest message in the channel, KPI or not
+    latest_ts: str = ""
+    # Whether fetching the channel failed; messages is None in that case
+    failed: bool = False
+
+
+@dataclass(slots=True, frozen=True)
+class PersonBatch:
+    """KPI messages of one person, with the latest message precomputed."""
+
+    person_name: str
+    # Newest first; None if the channel is unchanged since the last sync or
+    # could not be fetched
+    messages: Optional[list[KPIMessage]]
+    count: int
+    latest: Optional[KPIMessage]
+    # Slack ts of the newest message in the channel, KPI or not
+    latest_ts: str
+    # Whether fetching the channel failed
+    failed: bool
+
+    @classmethod
+    def from_history(cls, person_name: str, history: ChannelHistory) -> "PersonBatch":
+        """Build a batch from a fetched channel history.
+
+        Args:
+            person_name: Name of the person
+            history: KPI messages of the person's channel
+
+        Returns:
+            PersonBatch for the person
+        """
+        messages = history.messages
+        return cls(
+            person_name=person_name,
+            messages=messages,
+            count=len(messages) if messages else 0,
+            latest=messages[0] if messages else None,
+            latest_ts=history.latest_ts,
+            failed=history.failed
+        )
 
 
 @dataclass
@@ -29,11 +233,61 @@ class ChannelInfo:
     is_private: bool
 
 
+class RateLimiter:
+    """Async sliding-window limiter allowing max_calls per period seconds."""
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        """Initialize the rate limiter.
+
+        Args:
+            max_calls: Maximum number of calls within one period
+            period: Length of the window in seconds
+        """
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a call is allowed and record it."""
+        # Waiters queue on the lock, so calls are granted in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    break
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+            self._calls.append(time.monotonic())
+
+
 class SlackKPIClient:
     """Client for extracting KPI data from Slack channels."""
 
-    # Pattern to match individual channels (個人_名前 format)
-    INDIVIDUAL_CHANNEL_PATTERN = re.compile(r"^個人_(.+)$")
+    # Prefix and pattern of individual channels (個人_名前 format)
+    INDIVIDUAL_CHANNEL_PREFIX = _INDIVIDUAL_CHANNEL_PREFIX
+    INDIVIDUAL_CHANNEL_PATTERN = _INDIVIDUAL_CHANNEL_PATTERN
+
+    # Maximum number of channel histories fetched concurrently
+    MAX_CONCURRENT_FETCHES = 8
+
+    # conversations.history calls per minute (Slack's Tier 3 method limit)
+    HISTORY_CALLS_PER_MINUTE = 50
+
+    # System message subtypes that never carry KPI data. bot_message is not
+    # listed, as workflow and integration posts may report KPIs.
+    IGNORED_SUBTYPES = frozenset({
+        "channel_join",
+        "channel_leave",
+        "channel_topic",
+        "channel_purpose",
+        "channel_name",
+    })
+
+    # On-disk channel list cache, reused by CLI runs within the TTL (seconds)
+    CHANNEL_CACHE_DIR = os.path.expanduser("~/.cache/slack_kpi")
+    CHANNEL_CACHE_TTL = 300
 
     def __init__(self, bot_token: str):
         """Initialize the Slack client.
@@ -41,8 +295,19 @@ class SlackKPIClient:
         Args:
             bot_token: Slack Bot OAuth token
         """
-        self.client = WebClient(token=bot_token)
-        self._channel_cache: dict[str, ChannelInfo] = {}
+        self.bot_token = bot_token
+        # Rate-limited calls wait for Retry-After before retrying
+        self.client = WebClient(
+            token=bot_token,
+            retry_handlers=[
+                ConnectionErrorRetryHandler(),
+                RateLimitErrorRetryHandler(max_retry_count=3),
+                ServerErrorRetryHandler(max_retry_count=2),
+            ]
+        )
+        self._channel_cache: Optional[dict[str, ChannelInfo]] = None
+        # Workspace ID, set by test_connection() and used to key the disk cache
+        self.team_id: Optional[str] = None
 
     def test_connection(self) -> bool:
         """Test the Slack API connection.
@@ -52,50 +317,128 @@ class SlackKPIClient:
         """
         try:
             response = self.client.auth_test()
+            self.team_id = response.get("team_id")
             print(f"Connected to Slack workspace: {response['team']}")
             return True
         except SlackApiError as e:
             print(f"Failed to connect to Slack: {e.response['error']}")
             return False
 
-    def get_all_channels(self, include_private: bool = True) -> list[ChannelInfo]:
+    def get_all_channels(
+        self,
+        include_private: bool = True,
+        refresh: bool = False
+    ) -> list[ChannelInfo]:
         """Get all channels in the workspace.
 
         Args:
             include_private: Whether to include private channels
+            refresh: Whether to bypass the cached channel list
 
         Returns:
             List of channel information
         """
-        channels = []
+        channels = list(self.get_channel_map(refresh=refresh).values())
+        if not include_private:
+            channels = [channel for channel in channels if not channel.is_private]
+        return channels
+
+    def get_channel_map(self, refresh: bool = False) -> dict[str, ChannelInfo]:
+        """Get all channels in the workspace keyed by channel name.
+
+        The channel list is fetched once and cached for the lifetime of the
+        client. Once the workspace is known from test_connection(), it is
+        also cached on disk for CHANNEL_CACHE_TTL seconds.
+
+        Args:
+            refresh: Whether to bypass the cached channel list
+
+        Returns:
+            Dictionary mapping channel names to channel information
+        """
+        if self._channel_cache is not None and not refresh:
+            return self._channel_cache
+
+        if not refresh:
+            self._channel_cache = self._load_channel_cache()
+            if self._channel_cache is not None:
+                return self._channel_cache
+
+        channel_map = {}
 
         try:
-            # Get public channels
             cursor = None
             while True:
+                # Large pages avoid the slow pagination of small limits
                 response = self.client.conversations_list(
-                    types="public_channel,private_channel" if include_private else "public_channel",
-                    limit=200,
+                    types="public_channel,private_channel",
+                    limit=1000,
                     cursor=cursor
                 )
 
                 for channel in response["channels"]:
-                    info = ChannelInfo(
+                    channel_map[channel["name"]] = ChannelInfo(
                         id=channel["id"],
                         name=channel["name"],
                         is_private=channel.get("is_private", False)
                     )
-                    channels.append(info)
-                    self._channel_cache[channel["id"]] = info
 
                 cursor = response.get("response_metadata", {}).get("next_cursor")
                 if not cursor:
                     break
 
+            self._channel_cache = channel_map
+            self._save_channel_cache(channel_map)
+
         except SlackApiError as e:
             print(f"Error fetching channels: {e.response['error']}")
 
-        return channels
+        return channel_map
+
+    def _channel_cache_path(self) -> Optional[str]:
+        """Get the disk cache path for this workspace's channel list."""
+        if not self.team_id:
+            return None
+        return os.path.join(self.CHANNEL_CACHE_DIR, f"channels_{self.team_id}.json")
+
+    def _load_channel_cache(self) -> Optional[dict[str, ChannelInfo]]:
+        """Load the channel list from disk if it is fresh.
+
+        Returns:
+            Dictionary mapping channel names to channel information, or None
+            if there is no usable cache
+        """
+        path = self._channel_cache_path()
+        if not path:
+            return None
+
+        try:
+            if time.time() - os.path.getmtime(path) >= self.CHANNEL_CACHE_TTL:
+                return None
+            with open(path, encoding="utf-8") as f:
+                channels = json.load(f)
+            return {channel["name"]: ChannelInfo(**channel) for channel in channels}
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def _save_channel_cache(self, channel_map: dict[str, ChannelInfo]) -> None:
+        """Save the channel list to disk, ignoring failures."""
+        path = self._channel_cache_path()
+        if not path:
+            return
+
+        try:
+            os.makedirs(self.CHANNEL_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    [asdict(channel) for channel in channel_map.values()],
+                    f,
+                    ensure_ascii=False
+                )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write channel cache: {e}")
 
     def get_individual_channels(self) -> list[ChannelInfo]:
         """Get all individual KPI channels (個人_名前 format).
@@ -103,14 +446,10 @@ class SlackKPIClient:
         Returns:
             List of individual channel information
         """
-        all_channels = self.get_all_channels()
-        individual_channels = []
-
-        for channel in all_channels:
-            if self.INDIVIDUAL_CHANNEL_PATTERN.match(channel.name):
-                individual_channels.append(channel)
-
-        return individual_channels
+        return [
+            channel for channel in self.get_all_channels()
+            if _extract_person_name(channel.name)
+        ]
 
     def extract_person_name(self, channel_name: str) -> Optional[str]:
         """Extract person name from channel name.
@@ -121,10 +460,7 @@ class SlackKPIClient:
         Returns:
             Person name or None if not matching pattern
         """
-        match = self.INDIVIDUAL_CHANNEL_PATTERN.match(channel_name)
-        if match:
-            return match.group(1)
-        return None
+        return _extract_person_name(channel_name)
 
     def get_channel_messages(
         self,
@@ -148,8 +484,7 @@ class SlackKPIClient:
 
         try:
             kwargs = {
-                "channel": channel_id,
-                "limit": min(limit, 200)
+                "channel": channel_id
             }
 
             if oldest:
@@ -157,24 +492,14 @@ class SlackKPIClient:
             if latest:
                 kwargs["latest"] = str(latest.timestamp())
 
-            cursor = None
-            fetched = 0
-
-            while fetched < limit:
-                if cursor:
-                    kwargs["cursor"] = cursor
-
+            while len(messages) < limit:
+                kwargs["limit"] = _history_page_size(limit, len(messages))
                 response = self.client.conversations_history(**kwargs)
 
-                for msg in response["messages"]:
-                    if fetched >= limit:
-                        break
-                    messages.append(msg)
-                    fetched += 1
-
-                cursor = response.get("response_metadata", {}).get("next_cursor")
-                if not cursor:
+                cursor = _add_history_page(messages, response, limit)
+                if cursor is None:
                     break
+                kwargs["cursor"] = cursor
 
         except SlackApiError as e:
             print(f"Error fetching messages from channel {channel_id}: {e.response['error']}")
@@ -191,24 +516,25 @@ class SlackKPIClient:
         Returns:
             KPIMessage if KPI data found, None otherwise
         """
+        if message.get("subtype") in self.IGNORED_SUBTYPES:
+            return None
+
         text = message.get("text", "")
+        if not text.strip():
+            return None
 
         # Extract KPI values using common patterns
         kpi_values = self._extract_kpi_values(text)
 
-        if not kpi_values and not text.strip():
-            return None
-
-        timestamp = datetime.fromtimestamp(float(message.get("ts", 0)))
         person_name = self.extract_person_name(channel_info.name) or channel_info.name
 
         return KPIMessage(
             channel_id=channel_info.id,
             channel_name=channel_info.name,
             user_name=person_name,
-            timestamp=timestamp,
             text=text,
-            kpi_values=kpi_values
+            kpi_values=kpi_values,
+            ts=message.get("ts", "")
         )
 
     def _extract_kpi_values(self, text: str) -> dict[str, str]:
@@ -220,26 +546,7 @@ class SlackKPIClient:
         Returns:
             Dictionary of KPI names to values
         """
-        kpi_values = {}
-
-        # Common KPI patterns
-        patterns = [
-            # Pattern: "KPI名: 値" or "KPI名：値"
-            (r"([^\s:：]+)[:\s：]+(\d+(?:\.\d+)?(?:%|件|円|人|回)?)", r"\1", r"\2"),
-            # Pattern: "【KPI名】値"
-            (r"【([^】]+)】\s*(\d+(?:\.\d+)?(?:%|件|円|人|回)?)", r"\1", r"\2"),
-            # Pattern with specific KPI keywords
-            (r"(売上|契約|アポ|架電|面談|成約)[数件率]?\s*[:\s：]*(\d+(?:\.\d+)?(?:%|件|円|人|回)?)", r"\1", r"\2"),
-        ]
-
-        for pattern, _, _ in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple) and len(match) >= 2:
-                    key, value = match[0], match[1]
-                    kpi_values[key.strip()] = value.strip()
-
-        return kpi_values
+        return _extract_kpi_values(text)
 
     def get_kpi_data_from_channel(
         self,
@@ -253,38 +560,202 @@ class SlackKPIClient:
             limit: Maximum number of messages to process
 
         Returns:
-            List of KPI messages
+            List of KPI messages, newest first
+        """
+        history = self.get_kpi_data_from_channels([channel_info], limit)[channel_info.id]
+        return history.messages or []
+
+    def get_kpi_data_from_channels(
+        self,
+        channels: list[ChannelInfo],
+        limit: int = 100,
+        since: Optional[dict[str, str]] = None
+    ) -> dict[str, ChannelHistory]:
+        """Get KPI data from several channels concurrently.
+
+        Args:
+            channels: Channels to fetch
+            limit: Maximum number of messages to process per channel
+            since: Slack ts of the newest message seen by the last sync, keyed
+                by channel ID. Channels with nothing newer are not fetched
+                beyond their first page.
+
+        Returns:
+            Dictionary mapping channel IDs to their histories; the messages
+            are None for channels with no messages since the given ts and
+            for channels that could not be fetched
         """
-        messages = self.get_channel_messages(channel_info.id, limit=limit)
-        kpi_messages = []
+        return asyncio.run(self._fetch_kpi_data_async(channels, limit, since or {}))
+
+    async def _fetch_kpi_data_async(
+        self,
+        channels: list[ChannelInfo],
+        limit: int,
+        since: dict[str, str]
+    ) -> dict[str, ChannelHistory]:
+        """Fetch and parse channel histories with bounded concurrency.
+
+        Args:
+            channels: Channels to fetch
+            limit: Maximum number of messages to process per channel
+            since: Slack ts of the newest message seen by the last sync, keyed
+                by channel ID
+
+        Returns:
+            Dictionary mapping channel IDs to their histories
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
+        # Paces requests under the limit instead of relying on 429 retries
+        limiter = RateLimiter(self.HISTORY_CALLS_PER_MINUTE)
+
+        async with aiohttp.ClientSession() as session:
+            client = AsyncWebClient(
+                token=self.bot_token,
+                session=session,
+                retry_handlers=[
+                    AsyncConnectionErrorRetryHandler(),
+                    AsyncRateLimitErrorRetryHandler(max_retry_count=3),
+                    AsyncServerErrorRetryHandler(max_retry_count=2),
+                ]
+            )
+
+            async def fetch(channel: ChannelInfo) -> ChannelHistory:
+                async with semaphore:
+                    messages = await self._fetch_channel_history(
+                        client,
+                        limiter,
+                        channel.id,
+                        limit,
+                        since=_parse_ts(since.get(channel.id, ""))
+                    )
+
+                if messages is None:
+                    return ChannelHistory(messages=None)
+
+                kpi_messages = []
+                for msg in messages:
+                    kpi_msg = self.parse_kpi_message(msg, channel)
+                    if kpi_msg:
+                        kpi_messages.append(kpi_msg)
+                return ChannelHistory(
+                    messages=kpi_messages,
+                    latest_ts=messages[0]["ts"] if messages else ""
+                )
 
-        for msg in messages:
-            kpi_msg = self.parse_kpi_message(msg, channel_info)
-            if kpi_msg:
-                kpi_messages.append(kpi_msg)
+            # One failing channel must not discard the others' results
+            results = await asyncio.gather(
+                *(fetch(channel) for channel in channels),
+                return_exceptions=True
+            )
+
+        kpi_by_channel = {}
+        for channel, result in zip(channels, results):
+            if isinstance(result, SlackApiError):
+                print(f"Error fetching channel {channel.name}: {result.response['error']}")
+                result = ChannelHistory(messages=None, failed=True)
+            elif isinstance(result, Exception):
+                print(f"Error fetching channel {channel.name}: {result}")
+                result = ChannelHistory(messages=None, failed=True)
+            kpi_by_channel[channel.id] = result
+        return kpi_by_channel
+
+    async def _fetch_channel_history(
+        self,
+        client: AsyncWebClient,
+        limiter: RateLimiter,
+        channel_id: str,
+        limit: int,
+        since: Optional[Decimal] = None
+    ) -> Optional[list[dict]]:
+        """Get messages from a channel using the async client.
+
+        Args:
+            client: Async Slack client
+            limiter: Rate limiter for conversations.history
+            channel_id: Channel ID
+            limit: Maximum number of messages to retrieve
+            since: Slack ts of the newest message seen by the last sync
 
-        return kpi_messages
+        Returns:
+            List of message dictionaries, newest first, or None if the
+            channel has no messages newer than since
 
-    def get_all_individual_kpi_data(self, message_limit: int = 100) -> dict[str, list[KPIMessage]]:
+        Raises:
+            SlackApiError: If a history request fails, so that a partial
+                history is not mistaken for the whole channel
+        """
+        messages = []
+        kwargs = {
+            "channel": channel_id
+        }
+
+        while len(messages) < limit:
+            kwargs["limit"] = _history_page_size(limit, len(messages))
+            await limiter.acquire()
+            response = await client.conversations_history(**kwargs)
+            page = response["messages"]
+
+            # The first page tells whether anything is newer than the
+            # watermark, so unchanged channels cost one call
+            if since is not None and not messages and (
+                not page or Decimal(page[0]["ts"]) <= since
+            ):
+                return None
+
+            cursor = _add_history_page(messages, response, limit)
+            if cursor is None:
+                break
+            kwargs["cursor"] = cursor
+
+        return messages
+
+    def get_all_individual_kpi_data(
+        self,
+        message_limit: int = 100,
+        since: Optional[dict[str, str]] = None
+    ) -> list[PersonBatch]:
         """Get KPI data from all individual channels.
 
         Args:
             message_limit: Maximum messages per channel
+            since: Slack ts of the newest message seen by the last sync, keyed
+                by person name. Channels with nothing newer are not fetched
+                beyond their first page.
 
         Returns:
-            Dictionary mapping person names to their KPI messages
+            One PersonBatch per individual channel; its messages are None for
+            channels with no messages since the given ts
         """
         individual_channels = self.get_individual_channels()
-        all_kpi_data = {}
+        since = since or {}
+        batches = []
 
         print(f"Found {len(individual_channels)} individual channels")
 
+        targets = []
         for channel in individual_channels:
             person_name = self.extract_person_name(channel.name)
             if person_name:
-                print(f"Processing channel: {channel.name}")
-                kpi_messages = self.get_kpi_data_from_channel(channel, limit=message_limit)
-                all_kpi_data[person_name] = kpi_messages
-                print(f"  Found {len(kpi_messages)} messages")
+                targets.append((person_name, channel))
+
+        kpi_by_channel = self.get_kpi_data_from_channels(
+            [channel for _, channel in targets],
+            limit=message_limit,
+            since={
+                channel.id: since[person_name]
+                for person_name, channel in targets if person_name in since
+            }
+        )
 
-        return all_kpi_data
+        for person_name, channel in targets:
+            batch = PersonBatch.from_history(person_name, kpi_by_channel[channel.id])
+            batches.append(batch)
+            print(f"Processed channel: {channel.name}")
+            if batch.failed:
+                print("  Failed to fetch messages")
+            elif batch.messages is None:
+                print("  No new messages since last sync")
+            else:
+                print(f"  Found {batch.count} messages")
+
+        return batches